@@ -2,12 +2,16 @@
 
 This integration provides sensors for pollen forecasts from Pollenrapporten.
 """
+import asyncio
+from datetime import timedelta
 import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
+from homeassistant.const import CONF_SCAN_INTERVAL, Platform
 
-from .const import DOMAIN
+from .api import get_client
+from .const import DOMAIN, CONF_REGION_ID, DEFAULT_SCAN_INTERVAL
+from .coordinator import PollenDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,7 +28,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         True if setup was successful
     """
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    # Create the shared API client so all platforms and flows reuse it
+    client = get_client(hass)
+    
+    coordinator = PollenDataCoordinator(
+        hass,
+        api_client=client,
+        region_id=entry.data[CONF_REGION_ID],
+        update_interval=timedelta(
+            hours=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        ),
+    )
+    hass.data[DOMAIN][entry.entry_id] = {"coordinator": coordinator}
+    
+    # The first refresh loads the forecast, pollen types and level
+    # definitions. Only the regions, used for the sensor name, are left to
+    # prefetch alongside it. Errors are returned rather than raised.
+    refresh_result, _ = await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        client.get_regions(),
+        return_exceptions=True,
+    )
+    if isinstance(refresh_result, Exception):
+        _LOGGER.error("Error during initial data refresh: %s", refresh_result)
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
@@ -1,21 +1,40 @@
 """API client for Pollenrapporten.
 
 This module provides a client for interacting with the Pollenrapporten API.
-It handles fetching forecasts, regions, and pollen types.
+It handles fetching forecasts, regions, pollen types and level definitions.
 """
 import logging
 import aiohttp
-import async_timeout
 import asyncio
-import socket
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import time
+from operator import itemgetter
+from typing import Awaitable, Callable, Dict, Optional, Any, Tuple
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
-from .const import API_URL_FORECASTS, API_URL_REGIONS, API_URL_POLLEN_TYPES
+from .const import (
+    DOMAIN,
+    API_URL_FORECASTS,
+    API_URL_REGIONS,
+    API_URL_POLLEN_TYPES,
+    API_URL_LEVEL_DEFINITIONS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared per-request timeout handed straight to aiohttp
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_read=7)
+
+# Fields read from each levelSeries item of a forecast
+_LEVEL_FIELDS = itemgetter("time", "pollenId", "level")
+
+# Regions, pollen types and level definitions rarely change, refresh them once a day
+_CACHE_TTL = 86400  # seconds
+
+_Fetcher = Callable[
+    [Dict[str, str]], Awaitable[Tuple[Optional[str], Optional[Dict[str, str]]]]
+]
+
 class PollenPulsenApiClientError(Exception):
     """Exception raised for API errors."""
     
@@ -30,6 +49,38 @@ class PollenPulsenApiClientError(Exception):
         self.status_code = status_code
         super().__init__(self.message)
 
+def _raise_for_status(response: aiohttp.ClientResponse, what: str) -> None:
+    """Raise a PollenPulsenApiClientError if the response is an HTTP error.
+    
+    Args:
+        response: The response to check
+        what: Description of the fetched data, used in the log message
+    """
+    try:
+        response.raise_for_status()
+    except aiohttp.ClientResponseError as error:
+        _LOGGER.error(
+            "HTTP error %d while fetching %s: %s",
+            error.status,
+            what,
+            error.message
+        )
+        raise PollenPulsenApiClientError(
+            f"HTTP error {error.status}: {error.message}",
+            error.status
+        ) from error
+
+def get_client(hass) -> "PollenPulsenApiClient":
+    """Return the API client shared by all config entries and flows.
+
+    Sharing the client means its caches are shared as well, so regions and
+    pollen types are only fetched once per Home Assistant instance.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "_client" not in domain_data:
+        domain_data["_client"] = PollenPulsenApiClient(hass)
+    return domain_data["_client"]
+
 class PollenPulsenApiClient:
     """API client for Pollenpulsen."""
 
@@ -37,14 +88,21 @@ class PollenPulsenApiClient:
         """Initialize the API client."""
         self._hass = hass
         self._session = async_get_clientsession(hass)
-        self.region_id = ""
-        self._pollen_types_cache = {}
-        self._regions_cache = {}
+        # Shared between clients and kept across config entry reloads
+        self._http_cache = hass.data.setdefault(DOMAIN, {}).setdefault("_http_cache", {})
+        self._refreshing = set()
+        self._pending: Dict[str, asyncio.Task] = {}
+        # Last forecast item per region with its ETag and Last-Modified
+        self._forecast_cache: Dict[str, Tuple[Optional[str], Optional[str], Dict[str, Any]]] = {}
+        self._regions_sorted: Optional[Tuple[Dict[str, str], Dict[str, str]]] = None
         _LOGGER.debug("Initialized PollenPulsen API client")
 
-    async def get_forecasts(self) -> Dict[str, Any]:
-        """Get pollen forecasts for the configured region.
+    async def get_forecasts(self, region_id: str) -> Dict[str, Any]:
+        """Get pollen forecasts for a region.
         
+        Args:
+            region_id: The ID of the region to fetch forecasts for
+            
         Returns:
             A dictionary containing forecast data including pollen levels,
             start and end dates, and forecast text.
@@ -55,29 +113,44 @@ class PollenPulsenApiClient:
             asyncio.TimeoutError: If the request times out
         """
         try:
-            url = f"{API_URL_FORECASTS}?region_id={self.region_id}&current=true"
-            _LOGGER.debug("Fetching forecast data from: %s", url)
+            _LOGGER.debug("Fetching forecast data for region %s", region_id)
             
-            async with async_timeout.timeout(10):
-                response = await self._session.get(url)
-                
+            # Only download the forecast again if it changed since last time
+            headers = {}
+            if cached := self._forecast_cache.get(region_id):
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+            
+            async with self._session.get(
+                API_URL_FORECASTS,
+                params={"region_id": region_id, "current": "true"},
+                headers=headers,
+                timeout=_DEFAULT_TIMEOUT,
+            ) as response:
                 _LOGGER.debug("Forecast API response status: %s", response.status)
                 
-                if response.status >= 400:
-                    error_text = await response.text()
-                    _LOGGER.error(
-                        "HTTP error %d while fetching forecast data: %s", 
-                        response.status, 
-                        error_text
-                    )
-                    raise PollenPulsenApiClientError(
-                        f"HTTP error {response.status}: {error_text}", 
-                        response.status
-                    )
-                
-                data = await response.json()
-                _LOGGER.debug("Received forecast data: %s", data)
+                not_modified = response.status == 304
+                if not_modified:
+                    if not cached:
+                        # Only a proxy could answer 304 to an unconditional request
+                        _LOGGER.error("Forecast not modified but no forecast is cached")
+                        raise PollenPulsenApiClientError(
+                            "Forecast not modified but no forecast is cached"
+                        )
+                    _LOGGER.debug("Forecast for region %s not modified", region_id)
+                else:
+                    _raise_for_status(response, "forecast data")
+                    
+                    data = json_loads(await response.read())
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Received forecast data: %s", data)
                 
+            if not_modified:
+                forecast = cached[2]
+            else:
                 if not data:
                     _LOGGER.error("Empty response received from API")
                     raise PollenPulsenApiClientError("Empty response received from API")
@@ -86,36 +159,43 @@ class PollenPulsenApiClient:
                     _LOGGER.error("No forecast items received from API")
                     raise PollenPulsenApiClientError("No forecast items received from API")
                 
-                # Process the forecast data
                 forecast = data["items"][0]
-                result = {
-                    "start_date": forecast.get("startDate"),
-                    "end_date": forecast.get("endDate"),
-                    "text": forecast.get("text", ""),
-                    "pollen_levels": {}
-                }
-                
-                # Get today's date in the format used by the API
-                today = datetime.now().strftime("%Y-%m-%d")
-                _LOGGER.debug("Processing forecast data for date: %s", today)
-                
-                # Extract pollen levels for today
-                if "levelSeries" in forecast:
-                    for level_data in forecast["levelSeries"]:
-                        if today in level_data.get("time", ""):
-                            pollen_id = level_data.get("pollenId")
-                            level = level_data.get("level")
-                            if pollen_id and level is not None:
-                                result["pollen_levels"][pollen_id] = level
-                
-                _LOGGER.debug("Processed forecast data: %s", result)
-                return result
+                self._forecast_cache[region_id] = (
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    forecast,
+                )
+                
+            # Process the forecast data. This also runs for unchanged
+            # forecasts, since the levels to pick depend on today's date.
+            result = {
+                "start_date": forecast.get("startDate"),
+                "end_date": forecast.get("endDate"),
+                "text": forecast.get("text", ""),
+                "pollen_levels": {}
+            }
+                
+            # Get today's date in the format used by the API
+            today = time.strftime("%Y-%m-%d")
+            _LOGGER.debug("Processing forecast data for date: %s", today)
+                
+            # Extract pollen levels for today, the time field starts with the date
+            pollen_levels = result["pollen_levels"]
+            for level_data in forecast.get("levelSeries", ()):
+                try:
+                    time_value, pollen_id, level = _LEVEL_FIELDS(level_data)
+                except KeyError:
+                    continue
+                if pollen_id and level is not None and time_value.startswith(today):
+                    pollen_levels[pollen_id] = level
+                
+            return result
                 
         except aiohttp.ClientError as error:
             _LOGGER.error("Connection error fetching forecast data: %s", error)
             raise
         except asyncio.TimeoutError:
-            _LOGGER.error("Timeout fetching forecast data from: %s", url)
+            _LOGGER.error("Timeout fetching forecast data for region %s", region_id)
             raise
         except PollenPulsenApiClientError:
             raise
@@ -125,53 +205,88 @@ class PollenPulsenApiClient:
 
     async def get_regions(self) -> Dict[str, str]:
         """Get available regions from the API."""
-        # Return cached data if available
-        if self._regions_cache:
-            _LOGGER.debug("Returning cached regions data")
-            return self._regions_cache
+        return await self._get_cached(API_URL_REGIONS, self._fetch_regions)
+
+    @property
+    def regions(self) -> Dict[str, str]:
+        """Return the cached regions without fetching them."""
+        cached = self._http_cache.get(API_URL_REGIONS)
+        return cached[2] if cached else {}
+
+    async def get_regions_sorted(self) -> Dict[str, str]:
+        """Get available regions ordered by region name.
+
+        The sorted mapping is kept until the underlying regions change, so
+        re-rendering the config form does not sort the regions again.
+        """
+        regions = await self.get_regions()
+        if self._regions_sorted is None or self._regions_sorted[0] is not regions:
+            self._regions_sorted = (
+                regions,
+                dict(sorted(regions.items(), key=itemgetter(1))),
+            )
+        return self._regions_sorted[1]
+
+    async def _fetch_regions(
+        self, headers: Dict[str, str]
+    ) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+        """Fetch regions from the API.
 
+        Args:
+            headers: Conditional request headers to send along
+
+        Returns:
+            A tuple of (etag, regions). Regions is None if the server
+            answered 304 Not Modified.
+        """
         try:
             _LOGGER.debug("Fetching regions from %s", API_URL_REGIONS)
-            async with async_timeout.timeout(10):
-                response = await self._session.get(
-                    url=API_URL_REGIONS,
-                    headers={
-                        "Content-Type": "application/json",
-                    },
-                )
-                
+            async with self._session.get(
+                url=API_URL_REGIONS,
+                headers={
+                    "Content-Type": "application/json",
+                    **headers,
+                },
+                timeout=_DEFAULT_TIMEOUT,
+            ) as response:
                 _LOGGER.debug("Regions API response status: %s", response.status)
+
+                if response.status == 304:
+                    _LOGGER.debug("Regions not modified since last fetch")
+                    return None, None
                 
                 if response.status != 200:
                     _LOGGER.error("Failed to get regions, status code: %s", response.status)
-                    return {}
+                    return None, {}
                     
-                data = await response.json()
-                _LOGGER.debug("Received regions data: %s", data)
+                data = json_loads(await response.read())
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Received regions data: %s", data)
                 
-                if "items" not in data:
-                    _LOGGER.error("No 'items' key in regions response: %s", data)
-                    return {}
+            if "items" not in data:
+                _LOGGER.error("No 'items' key in regions response: %s", data)
+                return None, {}
                     
-                # Create a dictionary with region_id as key and region_name as value
-                regions = {region["id"]: region["name"] for region in data["items"]}
+            # Create a dictionary with region_id as key and region_name as value,
+            # skipping malformed items instead of failing the whole response
+            regions = {}
+            for region in data["items"]:
+                region_id = region.get("id")
+                name = region.get("name")
+                if region_id and name:
+                    regions[region_id] = name
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug("Parsed regions: %s", regions)
                 
-                if not regions:
-                    _LOGGER.error("No regions found in API response")
-                else:
-                    # Cache the successful response
-                    self._regions_cache = regions
+            if not regions:
+                _LOGGER.error("No regions found in API response")
                     
-                return regions
+            return response.headers.get("ETag"), regions
                 
         except asyncio.TimeoutError as error:
             _LOGGER.error("Timeout error fetching regions: %s", error)
             raise PollenPulsenApiClientError("Timeout error fetching regions") from error
-        except (KeyError, TypeError) as error:
-            _LOGGER.error("Error parsing regions response: %s", error)
-            raise PollenPulsenApiClientError("Error parsing regions response") from error
-        except (aiohttp.ClientError, socket.gaierror) as error:
+        except aiohttp.ClientError as error:
             _LOGGER.error("Error fetching regions: %s", error)
             raise PollenPulsenApiClientError("Error fetching regions") from error
         except Exception as error:
@@ -189,48 +304,57 @@ class PollenPulsenApiClient:
             aiohttp.ClientError: If there's a connection error
             asyncio.TimeoutError: If the request times out
         """
-        # Return cached data if available
-        if self._pollen_types_cache:
-            _LOGGER.debug("Returning cached pollen types data")
-            return self._pollen_types_cache
-            
+        return await self._get_cached(API_URL_POLLEN_TYPES, self._fetch_pollen_types)
+
+    async def _fetch_pollen_types(
+        self, headers: Dict[str, str]
+    ) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+        """Fetch pollen types from the API.
+
+        Args:
+            headers: Conditional request headers to send along
+
+        Returns:
+            A tuple of (etag, pollen_types). Pollen types is None if the
+            server answered 304 Not Modified.
+        """
         try:
             _LOGGER.debug("Fetching pollen types from %s", API_URL_POLLEN_TYPES)
-            async with async_timeout.timeout(10):
-                response = await self._session.get(API_URL_POLLEN_TYPES)
-                
+            async with self._session.get(
+                API_URL_POLLEN_TYPES, headers=headers, timeout=_DEFAULT_TIMEOUT
+            ) as response:
                 _LOGGER.debug("Pollen types API response status: %s", response.status)
+
+                if response.status == 304:
+                    _LOGGER.debug("Pollen types not modified since last fetch")
+                    return None, None
                 
-                if response.status >= 400:
-                    error_text = await response.text()
-                    _LOGGER.error(
-                        "HTTP error %d while fetching pollen types: %s", 
-                        response.status, 
-                        error_text
-                    )
-                    raise PollenPulsenApiClientError(
-                        f"HTTP error {response.status}: {error_text}", 
-                        response.status
-                    )
-                
-                data = await response.json()
-                _LOGGER.debug("Received pollen types data: %s", data)
-                
-                if not data or "items" not in data:
-                    _LOGGER.error("Invalid or empty response received when fetching pollen types")
-                    raise PollenPulsenApiClientError("Invalid or empty response when fetching pollen types")
-                
-                # Create a mapping of pollen type IDs to names from the items array
-                pollen_types = {item["id"]: item["name"] for item in data["items"]}
+                _raise_for_status(response, "pollen types")
+                
+                data = json_loads(await response.read())
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Received pollen types data: %s", data)
+                
+            if not data or "items" not in data:
+                _LOGGER.error("Invalid or empty response received when fetching pollen types")
+                raise PollenPulsenApiClientError("Invalid or empty response when fetching pollen types")
+                
+            # Create a mapping of pollen type IDs to names from the items array,
+            # skipping malformed items instead of failing the whole response
+            pollen_types = {}
+            for item in data["items"]:
+                pollen_id = item.get("id")
+                name = item.get("name")
+                if pollen_id and name:
+                    pollen_types[pollen_id] = name
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug("Parsed pollen types: %s", pollen_types)
                 
-                if not pollen_types:
-                    _LOGGER.error("No pollen types found in API response")
-                    raise PollenPulsenApiClientError("No pollen types found in API response")
+            if not pollen_types:
+                _LOGGER.error("No pollen types found in API response")
+                raise PollenPulsenApiClientError("No pollen types found in API response")
                 
-                # Cache the successful response
-                self._pollen_types_cache = pollen_types
-                return pollen_types
+            return response.headers.get("ETag"), pollen_types
                 
         except aiohttp.ClientError as error:
             _LOGGER.error("Connection error fetching pollen types: %s", error)
@@ -243,3 +367,146 @@ class PollenPulsenApiClient:
         except Exception as error:
             _LOGGER.exception("Unexpected error fetching pollen types: %s", error)
             raise PollenPulsenApiClientError(f"Unexpected error: {error}")
+
+    async def get_level_definitions(self) -> Dict[int, str]:
+        """Get the pollen level definitions from the API.
+        
+        Returns:
+            A dictionary mapping pollen levels to their descriptions.
+            
+        Raises:
+            PollenPulsenApiClientError: If there's an error fetching the data
+            aiohttp.ClientError: If there's a connection error
+            asyncio.TimeoutError: If the request times out
+        """
+        return await self._get_cached(
+            API_URL_LEVEL_DEFINITIONS, self._fetch_level_definitions
+        )
+
+    async def _fetch_level_definitions(
+        self, headers: Dict[str, str]
+    ) -> Tuple[Optional[str], Optional[Dict[int, str]]]:
+        """Fetch pollen level definitions from the API.
+
+        Args:
+            headers: Conditional request headers to send along
+
+        Returns:
+            A tuple of (etag, level_definitions). Level definitions is None
+            if the server answered 304 Not Modified.
+        """
+        try:
+            _LOGGER.debug("Fetching level definitions from %s", API_URL_LEVEL_DEFINITIONS)
+            async with self._session.get(
+                API_URL_LEVEL_DEFINITIONS, headers=headers, timeout=_DEFAULT_TIMEOUT
+            ) as response:
+                _LOGGER.debug("Level definitions API response status: %s", response.status)
+
+                if response.status == 304:
+                    _LOGGER.debug("Level definitions not modified since last fetch")
+                    return None, None
+                
+                _raise_for_status(response, "level definitions")
+                
+                data = json_loads(await response.read())
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Received level definitions data: %s", data)
+                
+            if not data or "items" not in data:
+                _LOGGER.error("Invalid or empty response received when fetching level definitions")
+                raise PollenPulsenApiClientError(
+                    "Invalid or empty response when fetching level definitions"
+                )
+                
+            # Map each level to its description, skipping malformed items
+            level_definitions = {}
+            for item in data["items"]:
+                level = item.get("level")
+                name = item.get("name")
+                if level is not None and name:
+                    level_definitions[level] = name
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Parsed level definitions: %s", level_definitions)
+                
+            if not level_definitions:
+                _LOGGER.error("No level definitions found in API response")
+                raise PollenPulsenApiClientError("No level definitions found in API response")
+                
+            return response.headers.get("ETag"), level_definitions
+                
+        except aiohttp.ClientError as error:
+            _LOGGER.error("Connection error fetching level definitions: %s", error)
+            raise
+        except asyncio.TimeoutError:
+            _LOGGER.error("Timeout fetching level definitions from: %s", API_URL_LEVEL_DEFINITIONS)
+            raise
+        except PollenPulsenApiClientError:
+            raise
+        except Exception as error:
+            _LOGGER.exception("Unexpected error fetching level definitions: %s", error)
+            raise PollenPulsenApiClientError(f"Unexpected error: {error}")
+
+    async def _get_cached(self, url: str, fetch: _Fetcher) -> Dict[str, str]:
+        """Return cached data for a URL, fetching it on a cache miss.
+
+        Entries older than the cache TTL are still returned, but trigger a
+        refresh in the background so the next caller gets fresh data.
+        Concurrent cache misses for the same URL wait for the same request.
+
+        Args:
+            url: The URL the data is cached under
+            fetch: Coroutine function fetching the data from the API
+
+        Returns:
+            The cached or freshly fetched data.
+        """
+        if (cached := self._http_cache.get(url)) is None:
+            # Let concurrent callers on a cold cache share a single request
+            if (pending := self._pending.get(url)) is None:
+                pending = self._hass.async_create_task(self._refresh(url, fetch))
+                self._pending[url] = pending
+                pending.add_done_callback(lambda _: self._pending.pop(url, None))
+            return await asyncio.shield(pending)
+
+        fetched_at, _, value = cached
+        if time.monotonic() - fetched_at > _CACHE_TTL and url not in self._refreshing:
+            _LOGGER.debug("Cached data for %s is stale, refreshing in background", url)
+            self._refreshing.add(url)
+            self._hass.async_create_background_task(
+                self._background_refresh(url, fetch), f"{DOMAIN} refresh {url}"
+            )
+        else:
+            _LOGGER.debug("Returning cached data for %s", url)
+        return value
+
+    async def _refresh(self, url: str, fetch: _Fetcher) -> Dict[str, str]:
+        """Fetch data for a URL and store it in the cache.
+
+        A previously seen ETag is sent along so an unchanged resource only
+        costs a 304 response.
+        """
+        cached = self._http_cache.get(url)
+        headers = {"If-None-Match": cached[1]} if cached and cached[1] else {}
+
+        etag, value = await fetch(headers)
+        if value is None:
+            if not cached:
+                # Only a proxy could answer 304 to an unconditional request
+                raise PollenPulsenApiClientError(
+                    f"Data for {url} not modified but nothing is cached"
+                )
+            # Not modified, keep the cached value and ETag
+            etag, value = cached[1], cached[2]
+
+        if value:
+            self._http_cache[url] = (time.monotonic(), etag, value)
+        return value
+
+    async def _background_refresh(self, url: str, fetch: _Fetcher) -> None:
+        """Refresh a stale cache entry, keeping the old value on failure."""
+        try:
+            await self._refresh(url, fetch)
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.warning("Error refreshing cached data for %s: %s", url, error)
+        finally:
+            self._refreshing.discard(url)
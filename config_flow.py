@@ -5,24 +5,25 @@ including fetching available regions and pollen types from the API.
 """
 import logging
 import voluptuous as vol
-import aiohttp
-import asyncio
 
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_NAME
-import homeassistant.helpers.config_validation as cv
 
 from .const import (
     DOMAIN, 
     DEFAULT_SCAN_INTERVAL,
     CONF_REGION_ID,
 )
-from .api import PollenPulsenApiClient, PollenPulsenApiClientError
+from .api import PollenPulsenApiClientError, get_client
 
 _LOGGER = logging.getLogger(__name__)
 
+# Schema parts that do not depend on API data, built once at import
+_NAME_KEY = vol.Required(CONF_NAME, default="Pollenpulsen")
+_SCAN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=24))
+
 class PollenpulsenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Pollenpulsen."""
 
@@ -40,7 +41,7 @@ class PollenpulsenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if self.api_client is None:
-            self.api_client = PollenPulsenApiClient(self.hass)
+            self.api_client = get_client(self.hass)
 
         if user_input is not None:
             try:
@@ -48,12 +49,10 @@ class PollenpulsenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 await self.async_set_unique_id(f"pollenpulsen_{user_input[CONF_REGION_ID]}")
                 self._abort_if_unique_id_configured()
                 
-                # Get region name for the title
-                try:
-                    regions = await self.api_client.get_regions()
-                    region_name = regions.get(user_input[CONF_REGION_ID], "Unknown")
-                except Exception:  # pylint: disable=broad-except
-                    region_name = user_input[CONF_REGION_ID]
+                # Get region name for the title, the regions were fetched
+                # when the form was shown
+                region_id = user_input[CONF_REGION_ID]
+                region_name = self.api_client.regions.get(region_id, region_id)
                 
                 return self.async_create_entry(
                     title=f"Pollenpulsen {region_name}",
@@ -68,16 +67,13 @@ class PollenpulsenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 
         # Get regions from API
         try:
-            regions = await self.api_client.get_regions()
+            regions = await self.api_client.get_regions_sorted()
             _LOGGER.debug("Received regions: %s", regions)
             
             if not regions:
                 _LOGGER.error("No regions received from API")
                 errors["base"] = "no_regions"
                 
-            # Sort regions by creating a new OrderedDict
-            regions = dict(sorted(regions.items(), key=lambda x: x[1]))
-                
         except PollenPulsenApiClientError:
             _LOGGER.error("Error getting regions")
             errors["base"] = "cannot_connect"
@@ -86,7 +82,7 @@ class PollenpulsenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Show form to select region
         region_schema = vol.Schema({
             vol.Required(CONF_REGION_ID): vol.In(regions),
-            vol.Required(CONF_NAME, default="Pollenpulsen"): str,
+            _NAME_KEY: str,
         })
 
         return self.async_show_form(
@@ -123,7 +119,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 default=self.config_entry.options.get(
                     CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                 ),
-            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=24)),
+            ): _SCAN_INTERVAL_VALIDATOR,
         }
 
         return self.async_show_form(
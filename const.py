@@ -1,5 +1,6 @@
 """Constants for the Pollenpulsen integration."""
 from datetime import timedelta
+import zoneinfo
 
 # Domain and API endpoints
 DOMAIN = "pollenpulsen"
@@ -16,4 +17,5 @@ CONF_NAME = "name"
 DEFAULT_SCAN_INTERVAL = 3  # hours
 
 # Misc constants
-ATTRIBUTION = "Data provided by the Palynological Laboratory at the Swedish Museum of Natural History"
\ No newline at end of file
+ATTRIBUTION = "Data provided by the Palynological Laboratory at the Swedish Museum of Natural History"
+STOCKHOLM_TZ = zoneinfo.ZoneInfo("Europe/Stockholm")
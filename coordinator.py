@@ -0,0 +1,163 @@
+"""Data update coordinator for Pollenpulsen integration.
+
+This module provides the coordinator that fetches pollen forecasts for a
+region and shares them between the sensor entities.
+"""
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import time
+from operator import itemgetter
+from typing import Any, Dict, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .api import PollenPulsenApiClient, PollenPulsenApiClientError
+from .const import STOCKHOLM_TZ
+
+_LOGGER = logging.getLogger(__name__)
+
+# Minimum delay before a failed lookup is requested again
+_LOOKUP_RETRY_DELAY = 900  # seconds
+
+class PollenDataCoordinator(DataUpdateCoordinator):
+    """Coordinator to fetch pollen data from the API."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api_client: PollenPulsenApiClient,
+        region_id: str,
+        update_interval: timedelta
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="Pollen Data",
+            update_interval=update_interval,
+        )
+        self.api_client = api_client
+        self.region_id = region_id
+        self._last_successful_data: Dict[str, Any] = {}
+        self._level_definitions: Dict[int, str] = {}
+        self._pollen_types: Dict[str, str] = {}
+        # Monotonic times before which failed lookups are not retried
+        self._level_definitions_retry_at = 0.0
+        self._pollen_types_retry_at = 0.0
+        # The pollen types and level definitions the last list was resolved with
+        self._resolved_with: Tuple[Dict[str, str], Dict[int, str]] = ({}, {})
+
+    async def _async_update_data(self) -> Dict[str, Any]:
+        """Fetch data from API."""
+        try:
+            if self._level_definitions and self._pollen_types:
+                # The lookups are loaded, periodic updates only need the forecast
+                data = await self.api_client.get_forecasts(self.region_id)
+            else:
+                data = await self._async_fetch_with_lookups()
+
+            last = self._last_successful_data
+            pollen_types = self._pollen_types
+            level_definitions = self._level_definitions
+            resolved_pollen_types, resolved_level_definitions = self._resolved_with
+            if (
+                data
+                and last
+                and resolved_pollen_types is pollen_types
+                and resolved_level_definitions is level_definitions
+                and data["pollen_levels"] == last["pollen_levels"]
+            ):
+                # Levels are unchanged, which is the common case as the API
+                # answers 304 until the next daily forecast. The last list was
+                # resolved with the current lookups, so it still holds.
+                data["_forecast_pollen_list"] = last["_forecast_pollen_list"]
+                data["_last_updated_iso"] = datetime.now(STOCKHOLM_TZ).isoformat()
+                self._last_successful_data = data
+            elif data:
+                # Resolve pollen type names and level descriptions once per
+                # update, sorted by type, so entities never join them per read
+                data["_forecast_pollen_list"] = sorted(
+                    (
+                        {
+                            "type": pollen_types.get(pollen_id, pollen_id),
+                            "type_id": pollen_id,
+                            "level": level,
+                            "description": level_definitions.get(
+                                level, f"Okänd nivå: {level}"
+                            ),
+                        }
+                        for pollen_id, level in data["pollen_levels"].items()
+                    ),
+                    key=itemgetter("type"),
+                )
+                self._resolved_with = (pollen_types, level_definitions)
+                # Time of this update, rather than of each attribute read
+                data["_last_updated_iso"] = datetime.now(STOCKHOLM_TZ).isoformat()
+                self._last_successful_data = data
+            return data
+
+        except PollenPulsenApiClientError as err:
+            if self._last_successful_data:
+                _LOGGER.warning(
+                    "Error fetching data: %s. Using cached data from last successful update.",
+                    err
+                )
+                return self._last_successful_data
+            raise UpdateFailed(f"API error: {err}") from err
+        except Exception as err:
+            if self._last_successful_data:
+                _LOGGER.warning(
+                    "Unexpected error fetching data: %s. Using cached data from last successful update.",
+                    err
+                )
+                return self._last_successful_data
+            raise UpdateFailed(f"Error fetching data: {err}") from err
+
+    async def _async_fetch_with_lookups(self) -> Dict[str, Any]:
+        """Fetch the forecast together with the lookups it is resolved against.
+        
+        Runs until both the level definitions and pollen types are loaded,
+        so the first refresh costs a single round-trip. Only the lookups
+        still missing are requested.
+        """
+        data, _, _ = await asyncio.gather(
+            self.api_client.get_forecasts(self.region_id),
+            self._async_fetch_level_definitions(),
+            self._async_fetch_pollen_types(),
+        )
+        return data
+
+    async def _async_fetch_level_definitions(self) -> None:
+        """Fetch the level definitions unless they are already loaded.
+        
+        Errors are logged rather than raised so they do not fail the
+        forecast update; the fetch is retried on a later update, at most
+        once per _LOOKUP_RETRY_DELAY.
+        """
+        if self._level_definitions or time.monotonic() < self._level_definitions_retry_at:
+            return
+        try:
+            self._level_definitions = await self.api_client.get_level_definitions()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Error fetching level definitions: %s", err)
+            self._level_definitions_retry_at = time.monotonic() + _LOOKUP_RETRY_DELAY
+
+    async def _async_fetch_pollen_types(self) -> None:
+        """Fetch the pollen types unless they are already loaded.
+        
+        Errors are logged rather than raised so they do not fail the
+        forecast update; the fetch is retried on a later update, at most
+        once per _LOOKUP_RETRY_DELAY.
+        """
+        if self._pollen_types or time.monotonic() < self._pollen_types_retry_at:
+            return
+        try:
+            self._pollen_types = await self.api_client.get_pollen_types()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Error fetching pollen types: %s", err)
+            self._pollen_types_retry_at = time.monotonic() + _LOOKUP_RETRY_DELAY
@@ -2,147 +2,60 @@
 
 This module provides sensor entities for pollen levels and forecasts.
 """
-from datetime import timedelta, datetime
 import logging
-from typing import Any, Dict
-import async_timeout
-import zoneinfo
+from typing import Any, Dict, Optional
 
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.config_entries import ConfigEntry
 
 from .const import (
     DOMAIN,
     ATTRIBUTION,
     CONF_REGION_ID,
-    DEFAULT_SCAN_INTERVAL,
-    API_URL_LEVEL_DEFINITIONS,
 )
-from .api import PollenPulsenApiClient, PollenPulsenApiClientError
+from .api import get_client
+from .coordinator import PollenDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Folds the Swedish letters in region names so unique IDs are ASCII
+_FOLD = str.maketrans({"å": "a", "ä": "a", "ö": "o", "Å": "a", "Ä": "a", "Ö": "o"})
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Pollenpulsen sensor from a config entry."""
     region_id = entry.data[CONF_REGION_ID]
-    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    
-    api_client = PollenPulsenApiClient(hass)
-    api_client.region_id = region_id
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     
+    # Regions are prefetched during entry setup, so this is a cache hit
     try:
-        regions = await api_client.get_regions()
+        regions = await get_client(hass).get_regions()
         region_name = regions.get(region_id, region_id)
     except Exception as err:  # pylint: disable=broad-except
         _LOGGER.error("Error fetching region names: %s", err)
         region_name = region_id
     
-    coordinator = PollenDataCoordinator(
-        hass,
-        api_client=api_client,
-        update_interval=timedelta(hours=scan_interval)
-    )
+    # Unique IDs used to keep the Swedish letters, move existing entities
+    # to the folded ID so they keep their entity ID and history
+    @callback
+    def _fold_unique_id(entity_entry: er.RegistryEntry) -> Optional[Dict[str, Any]]:
+        folded = entity_entry.unique_id.translate(_FOLD)
+        if folded == entity_entry.unique_id:
+            return None
+        return {"new_unique_id": folded}
     
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:  # pylint: disable=broad-except
-        _LOGGER.error("Error during initial data refresh: %s", err)
+    await er.async_migrate_entries(hass, entry.entry_id, _fold_unique_id)
     
     async_add_entities([PollenForecastSensor(coordinator, region_id, region_name)])
 
-class PollenDataCoordinator(DataUpdateCoordinator):
-    """Coordinator to fetch pollen data from the API."""
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        api_client: PollenPulsenApiClient,
-        update_interval: timedelta
-    ) -> None:
-        """Initialize the coordinator."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name="Pollen Data",
-            update_interval=update_interval,
-        )
-        self.api_client = api_client
-        self._session = async_get_clientsession(hass)
-        self._last_successful_data = {}
-        self._level_definitions = {}
-
-    async def _async_update_data(self) -> Dict[str, Any]:
-        """Fetch data from API."""
-        try:
-            # Fetch level definitions if we don't have them yet
-            if not self._level_definitions:
-                try:
-                    async with async_timeout.timeout(10):
-                        response = await self._session.get(API_URL_LEVEL_DEFINITIONS)
-                        if response.status == 200:
-                            data = await response.json()
-                            if "items" in data:
-                                self._level_definitions = {
-                                    item["level"]: item["name"]
-                                    for item in data["items"]
-                                }
-                                _LOGGER.debug("Fetched pollen level definitions: %s", self._level_definitions)
-                        else:
-                            _LOGGER.warning(
-                                "Failed to fetch level definitions, status: %s", 
-                                response.status
-                            )
-                except Exception as err:
-                    _LOGGER.warning("Error fetching level definitions: %s", err)
-
-            # Fetch pollen types if we don't have them
-            if not hasattr(self, '_pollen_types'):
-                try:
-                    self._pollen_types = await self.api_client.get_pollen_types()
-                except Exception as err:
-                    _LOGGER.warning("Error fetching pollen types: %s", err)
-                    self._pollen_types = {}
-
-            # Fetch regular forecast data
-            data = await self.api_client.get_forecasts()
-            if data:
-                # Add level definitions and pollen types to the data
-                data["level_definitions"] = self._level_definitions
-                data["pollen_types"] = self._pollen_types
-                self._last_successful_data = data
-            return data
-
-        except PollenPulsenApiClientError as err:
-            if self._last_successful_data:
-                _LOGGER.warning(
-                    "Error fetching data: %s. Using cached data from last successful update.",
-                    err
-                )
-                return self._last_successful_data
-            raise UpdateFailed(f"API error: {err}") from err
-        except Exception as err:
-            if self._last_successful_data:
-                _LOGGER.warning(
-                    "Unexpected error fetching data: %s. Using cached data from last successful update.",
-                    err
-                )
-                return self._last_successful_data
-            raise UpdateFailed(f"Error fetching data: {err}") from err
-
 class PollenForecastSensor(CoordinatorEntity, SensorEntity):
     """Main sensor entity for pollen forecast."""
 
@@ -158,54 +71,47 @@ class PollenForecastSensor(CoordinatorEntity, SensorEntity):
         self._region_name = region_name
         
         self._attr_name = f"Pollenprognos {region_name}"
-        self._attr_unique_id = f"pollenprognos_{region_name.lower()}"
+        self._attr_unique_id = f"pollenprognos_{region_name.translate(_FOLD).lower()}"
         self._attr_icon = "mdi:flower-pollen"
         
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return "unavailable"
+        # Metadata attributes that never change for this sensor
+        self._metadata_base = {"attribution": ATTRIBUTION}
         
-        if self.coordinator.data.get("pollen_levels"):
-            return "active"
-        return "no_data"
+        # State and attributes are pushed on each coordinator update; set
+        # them from the data of the first refresh right away
+        self._update_attrs()
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the state and attributes when the coordinator updates."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes with the structured data format."""
-        if not self.coordinator.data:
-            return {}
-            
-        attributes = {
-            "last_updated": datetime.now(zoneinfo.ZoneInfo("Europe/Stockholm")).isoformat(),
+    def _update_attrs(self) -> None:
+        """Compute the state and attributes from the coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            self._attr_native_value = "unavailable"
+            self._attr_extra_state_attributes = {}
+            return
+        self._attr_native_value = "active" if data["pollen_levels"] else "no_data"
+        self._attr_extra_state_attributes = self._build_attributes(data)
+    
+    def _build_attributes(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the state attributes from non-empty coordinator data."""
+        # Read once per coordinator update, not on every attribute access
+        metadata = self._metadata_base.copy()
+        metadata["last_update_success"] = self.coordinator.last_update_success
+        
+        return {
+            "last_updated": data.get("_last_updated_iso"),
             "forecast": {
-                "text": self.coordinator.data.get("text", "Ingen prognos tillgänglig"),
-                "start_date": self.coordinator.data.get("start_date"),
-                "end_date": self.coordinator.data.get("end_date"),
-                "region": self._region_name
+                "text": data.get("text", "Ingen prognos tillgänglig"),
+                "start_date": data.get("start_date"),
+                "end_date": data.get("end_date"),
+                "region": self._region_name,
             },
-            "pollen_levels": [],
-            "metadata": {
-                "attribution": ATTRIBUTION,
-                "last_update_success": self.coordinator.last_update_success
-            }
+            # Entries are resolved and sorted by type in the coordinator
+            "pollen_levels": data["_forecast_pollen_list"],
+            "metadata": metadata
         }
-        
-        if pollen_levels := self.coordinator.data.get("pollen_levels", {}):
-            pollen_types = self.coordinator.data.get("pollen_types", {})
-            level_definitions = self.coordinator.data.get("level_definitions", {})
-            
-            for pollen_id, level in pollen_levels.items():
-                pollen_info = {
-                    "type": pollen_types.get(pollen_id, pollen_id),
-                    "type_id": pollen_id,
-                    "level": level,
-                    "description": level_definitions.get(level, f"Okänd nivå: {level}")
-                }
-                attributes["pollen_levels"].append(pollen_info)
-        
-        # Sort pollen levels alphabetically by type
-        attributes["pollen_levels"].sort(key=lambda x: x["type"])
-        
-        return attributes
\ No newline at end of file